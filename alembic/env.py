@@ -53,9 +53,7 @@ def run_migrations_offline() -> None:
     script output.
 
     """
-    db_url_str = app_settings.DATABASE_URL.render_as_string(hide_password=False) \
-        if hasattr(app_settings.DATABASE_URL, 'render_as_string') \
-        else str(app_settings.DATABASE_URL)
+    db_url_str = app_settings.SQLALCHEMY_URL
     # For offline mode, ensure we use a URL string that a sync engine can handle
     # if your main URL is async only. Usually, for offline, it just generates SQL.
     # If your DATABASE_URL uses 'postgresql+asyncpg', replace with 'postgresql' for offline.
@@ -89,9 +87,7 @@ def do_run_migrations(connection):
 async def run_migrations_online() -> None:
     """Run migrations in 'online' mode."""
 
-    db_url_str = app_settings.DATABASE_URL.render_as_string(hide_password=False) \
-        if hasattr(app_settings.DATABASE_URL, 'render_as_string') \
-        else str(app_settings.DATABASE_URL)
+    db_url_str = app_settings.SQLALCHEMY_URL
 
     connectable = create_async_engine(db_url_str, poolclass=pool.NullPool)
     async with connectable.connect() as connection:
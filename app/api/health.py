@@ -1,117 +1,113 @@
-from fastapi import APIRouter, Depends, Response, status
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import text
-from app.core.dependencies import get_db_session
-from app.core.redis_client import get_redis_app_cache_client
-import redis.asyncio as aioredis
-from typing import Dict, Optional
+import asyncio
+import orjson
+from fastapi import APIRouter, Response, status
+from app.core.config import settings
+from app.core.db import get_probe_pool
+from app.core.redis_client import cached_ping
+from typing import Dict, Optional, Tuple, Union
 
 router = APIRouter(tags=["health"])
 
-@router.get("/health")
-async def health_check(
-    db: Optional[AsyncSession] = Depends(get_db_session),
-) -> Dict[str, str]:
+# Order in which dependency results are returned by asyncio.gather()
+_DEPENDENCY_NAMES = ("database", "redis")
+
+# Happy-path bodies never change, so they are serialized once at import.
+# Probes hit these every few seconds per replica; only degraded responses
+# go through FastAPI's regular serialization.
+_ALIVE_BODY = orjson.dumps({"status": "alive"})
+_HEALTH_OK_BODY = orjson.dumps({"status": "ok", **{name: "ok" for name in _DEPENDENCY_NAMES}})
+_READY_BODY = orjson.dumps({"status": "ready", **{name: "up" for name in _DEPENDENCY_NAMES}})
+
+
+def _json_response(body: bytes) -> Response:
+    # A fresh Response per request: middleware may alter a response's headers
+    return Response(content=body, media_type="application/json")
+
+
+async def _ping_db() -> Optional[int]:
+    # Probes use their own small asyncpg pool rather than the SQLAlchemy
+    # engine: no statement compilation or result processing, and no
+    # competing with application traffic for pooled connections.
+    probe_pool = await get_probe_pool()
+    if probe_pool is None:
+        return None
+    async with probe_pool.acquire() as conn:
+        return await conn.fetchval("SELECT 1")
+
+
+async def _check_db() -> Tuple[str, str]:
+    """Run a trivial query against the database and report its status."""
+    try:
+        value = await asyncio.wait_for(_ping_db(), timeout=settings.HEALTH_CHECK_TIMEOUT_S)
+    except asyncio.TimeoutError:
+        return "database", "timeout"
+    except Exception as e:
+        return "database", f"error: {str(e)}"
+    if value is None:
+        return "database", "not available"
+    return "database", "ok" if value == 1 else "error"
+
+
+async def _check_redis() -> Tuple[str, str]:
+    """Ping the application Redis cache and report its status."""
+    # cached_ping() bounds pool initialization and the PING by
+    # HEALTH_CHECK_TIMEOUT_S and reports failures instead of raising
+    return "redis", await cached_ping()
+
+
+async def _run_dependency_checks() -> Dict[str, str]:
+    """
+    Check all critical dependencies concurrently, so the total latency is
+    bounded by the slowest dependency rather than the sum of all of them.
+    """
+    results = await asyncio.gather(
+        _check_db(), _check_redis(), return_exceptions=True
+    )
+    checks: Dict[str, str] = {}
+    for name, result in zip(_DEPENDENCY_NAMES, results):
+        if isinstance(result, BaseException):
+            checks[name] = f"error: {str(result)}"
+        else:
+            checks[name] = result[1]
+    return checks
+
+
+@router.get("/health", response_model=Dict[str, str])
+async def health_check() -> Union[Dict[str, str], Response]:
     """
     Health check endpoint to verify the application is running
     and its connections to critical dependencies are working.
     """
-    health_status = {
-        "status": "ok",
-        "database": "unknown",
-        "redis": "unknown"
-    }
-    
-    # Check database connection
-    if db is not None:
-        try:
-            # Use simple query to validate connection with text() function
-            result = await db.execute(text("SELECT 1"))
-            if result.scalar_one() == 1:
-                health_status["database"] = "ok"
-            else:
-                health_status["database"] = "error"
-        except Exception as e:
-            health_status["database"] = f"error: {str(e)}"
-            health_status["status"] = "degraded"
-    else:
-        health_status["database"] = "not available"
-        health_status["status"] = "degraded"
-    
-    # Check Redis connection
-    redis_client = await get_redis_app_cache_client()
-    if redis_client is not None:
-        try:
-            if await redis_client.ping():
-                health_status["redis"] = "ok"
-            else:
-                health_status["redis"] = "error"
-                health_status["status"] = "degraded"
-        except Exception as e:
-            health_status["redis"] = f"error: {str(e)}"
-            health_status["status"] = "degraded"
-    else:
-        health_status["redis"] = "not available"
-        health_status["status"] = "degraded"
-    
-    return health_status
+    checks = await _run_dependency_checks()
+    if all(value == "ok" for value in checks.values()):
+        return _json_response(_HEALTH_OK_BODY)
+    return {"status": "degraded", **checks}
 
 @router.get("/healthz/live", include_in_schema=False)
-async def liveness_check() -> Dict[str, str]:
+async def liveness_check() -> Response:
     """
     Liveness probe endpoint for Kubernetes/container orchestrators.
     Returns 200 OK as long as the application is running.
     """
-    return {"status": "alive"}
+    # Deliberately no database/Redis dependencies here: coupling liveness to
+    # external services makes the orchestrator restart every pod whenever a
+    # shared dependency hiccups (restart storms). Dependency checks belong in
+    # the readiness probe only.
+    return _json_response(_ALIVE_BODY)
 
-@router.get("/healthz/ready", include_in_schema=False)
-async def readiness_check(
-    response: Response,
-    db: Optional[AsyncSession] = Depends(get_db_session),
-) -> Dict[str, str]:
+@router.get("/healthz/ready", include_in_schema=False, response_model=Dict[str, str])
+async def readiness_check(response: Response) -> Union[Dict[str, str], Response]:
     """
     Readiness probe endpoint for Kubernetes/container orchestrators.
-    Verifies the application is ready to receive traffic by checking 
+    Verifies the application is ready to receive traffic by checking
     connectivity to critical dependencies like the database and Redis.
     """
-    is_ready = True
-    status_details = {
-        "status": "ready",
-        "database": "up",
-        "redis": "up"
+    checks = await _run_dependency_checks()
+    if all(value == "ok" for value in checks.values()):
+        return _json_response(_READY_BODY)
+
+    response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return {
+        "status": "not ready",
+        **{name: "up" if value == "ok" else "down" for name, value in checks.items()},
     }
-    
-    # Check database connection
-    if db is not None:
-        try:
-            result = await db.execute(text("SELECT 1"))
-            if result.scalar_one() != 1:
-                status_details["database"] = "down"
-                is_ready = False
-        except Exception:
-            status_details["database"] = "down"
-            is_ready = False
-    else:
-        status_details["database"] = "down"
-        is_ready = False
-    
-    # Check Redis connection
-    redis_client = await get_redis_app_cache_client()
-    if redis_client is not None:
-        try:
-            if not await redis_client.ping():
-                status_details["redis"] = "down"
-                is_ready = False
-        except Exception:
-            status_details["redis"] = "down"
-            is_ready = False
-    else:
-        status_details["redis"] = "down"
-        is_ready = False
-    
-    # Set overall status
-    if not is_ready:
-        status_details["status"] = "not ready"
-        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
-    
-    return status_details 
\ No newline at end of file
@@ -1,6 +1,7 @@
+from functools import cached_property
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import List, Optional
-from pydantic import PostgresDsn, AnyHttpUrl
+from pydantic import PostgresDsn, AnyHttpUrl, computed_field
 
 class Settings(BaseSettings):
     # Application Core
@@ -17,8 +18,16 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: PostgresDsn  # Must be provided via env or .env
     DB_ECHO_SQL: bool = False  # For debugging SQL in development
-    DB_POOL_SIZE: int = 5
-    DB_MAX_OVERFLOW: int = 10
+    # pool_size + max_overflow should cover the expected number of concurrent
+    # requests touching the DB per worker, within the server's max_connections.
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_TIMEOUT: float = 10.0  # Seconds to wait for a free connection before failing
+    DB_POOL_RECYCLE: int = 1800  # Replace connections older than this (seconds)
+    # Liveness-check pooled connections only if they sat idle longer than this
+    # (seconds), instead of pinging on every checkout (pool_pre_ping).
+    # Set to 0 to ping on every checkout.
+    DB_POOL_PRE_PING_IDLE_S: float = 10.0
 
     # Redis
     REDIS_HOST: str = "localhost"
@@ -26,6 +35,41 @@ class Settings(BaseSettings):
     REDIS_PASSWORD: Optional[str] = None
     REDIS_CACHE_DB: int = 1
     REDIS_MAX_CONNECTIONS: int = 20  # For the general application cache pool
+    REDIS_SOCKET_TIMEOUT: float = 2.0  # Seconds; bounds any single command
+    REDIS_SOCKET_CONNECT_TIMEOUT: float = 2.0
+    REDIS_HEALTH_CHECK_INTERVAL: int = 30  # Seconds idle before a connection is re-checked on use
+    # Per-process cache in front of GET/MGET for get_redis_local_cache_client();
+    # disabled while either is 0
+    REDIS_LOCAL_CACHE_SIZE: int = 0  # Max number of keys, e.g. 1024
+    REDIS_LOCAL_CACHE_TTL: float = 1.0  # Seconds; upper bound on staleness of local reads
+
+    # Lifespan
+    # Per-initializer budget at startup/shutdown. A dependency that isn't
+    # reachable in time is skipped and retried on first use, so an outage
+    # can't keep the app (and its liveness probe) from starting.
+    STARTUP_TIMEOUT_S: float = 3.0
+
+    # Health checks
+    HEALTH_CHECK_TIMEOUT_S: float = 1.5  # Per-dependency budget; keep below the probe's timeoutSeconds
+
+    # CORS origins as plain strings, as expected by CORSMiddleware. Pydantic
+    # renders AnyHttpUrl with a trailing "/", which would never match a
+    # browser's Origin header, so it is stripped.
+    @computed_field  # type: ignore[prop-decorator]
+    @cached_property
+    def CORS_ORIGINS_STR(self) -> List[str]:
+        return [str(origin).rstrip("/") for origin in self.CORS_ALLOWED_ORIGINS]
+
+    # Database URL rendered once as the plain string SQLAlchemy expects.
+    # repr=False keeps the password out of repr()/logs of the settings object.
+    @computed_field(repr=False)  # type: ignore[prop-decorator]
+    @cached_property
+    def SQLALCHEMY_URL(self) -> str:
+        return (
+            self.DATABASE_URL.render_as_string(hide_password=False)
+            if hasattr(self.DATABASE_URL, 'render_as_string')
+            else str(self.DATABASE_URL)
+        )
 
     # Construct full URL from components
     @property
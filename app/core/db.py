@@ -1,3 +1,9 @@
+import asyncio
+import time
+from typing import Optional
+import asyncpg  # type: ignore[import-untyped]
+from sqlalchemy import event, exc, text
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from app.core.config import settings
@@ -5,20 +11,49 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+
+def _install_idle_pre_ping(engine: Engine, idle_seconds: float) -> None:
+    """
+    Pings pooled connections on checkout only if they have been idle for more
+    than `idle_seconds`. Unlike pool_pre_ping=True, busy connections are handed
+    out without an extra SELECT 1 round-trip, while connections that may have
+    been dropped by the server or a proxy while idle are still verified.
+    """
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        connection_record.info["last_used"] = time.monotonic()
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        connection_record.info["last_used"] = time.monotonic()
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        last_used = connection_record.info.get("last_used", 0.0)
+        if time.monotonic() - last_used <= idle_seconds:
+            return
+        try:
+            engine.dialect.do_ping(dbapi_connection)
+        except Exception as e:
+            # The pool invalidates this connection and retries with a fresh one
+            raise exc.DisconnectionError(f"Stale pooled connection: {e}") from e
+
 # Create an asynchronous engine instance
 # The URL should be the fully qualified database URL from settings
 # echo=settings.DB_ECHO_SQL can be useful for development to see generated SQL
 try:
     async_engine = create_async_engine(
-        settings.DATABASE_URL.render_as_string(hide_password=False)
-            if hasattr(settings.DATABASE_URL, 'render_as_string')
-            else str(settings.DATABASE_URL),
+        settings.SQLALCHEMY_URL,
         echo=settings.DB_ECHO_SQL,
-        pool_pre_ping=True,  # Good practice to check connections before use
+        pool_pre_ping=False,  # Replaced by the idle-gated ping installed below
         # Adjust pool size based on expected concurrency and DB limits
-        pool_size=settings.DB_POOL_SIZE, # Example, make configurable
-        max_overflow=settings.DB_MAX_OVERFLOW, # Example
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
     )
+    _install_idle_pre_ping(async_engine.sync_engine, settings.DB_POOL_PRE_PING_IDLE_S)
 except Exception as e:
     logger.error(f"Failed to create SQLAlchemy async engine: {e}", exc_info=True)
     # Depending on how critical DB is at import time, you might raise or handle
@@ -39,21 +74,76 @@ AsyncSessionFactory = async_sessionmaker(
 # Declarative base for ORM models
 Base = declarative_base()
 
-# Optional: Functions for explicit engine connect/disconnect if needed by app lifecycle
-# async def connect_db():
-#     # Engine connects on first use, but explicit connect can be for health checks
-#     if async_engine:
-#        try:
-#            async with async_engine.connect() as conn:
-#                await conn.execute(text("SELECT 1"))
-#            logger.info("Database connection successful.")
-#        except Exception as e:
-#            logger.error(f"Database connection failed on startup: {e}", exc_info=True)
+# Small raw asyncpg pool reserved for health probes. It is separate from the
+# SQLAlchemy pool so probes skip the SQLAlchemy layer entirely, and so they
+# keep succeeding while application traffic has exhausted the main pool.
+_probe_pool: Optional[asyncpg.Pool] = None
+# Set after a failed init, so repeated failures (one per probe while the
+# database is down) are logged without a full traceback
+_probe_pool_init_failed: bool = False
+# Serializes pool creation, so concurrent first probes don't each build (and leak) a pool
+_probe_pool_lock = asyncio.Lock()
+
+async def init_probe_pool() -> Optional[asyncpg.Pool]:
+    """Initializes the asyncpg connection pool used by health probes."""
+    global _probe_pool, _probe_pool_init_failed
+    async with _probe_pool_lock:
+        # Re-checked under the lock: another caller may have created it meanwhile
+        if _probe_pool is None:
+            try:
+                # asyncpg expects a plain postgresql:// DSN, without the "+asyncpg" driver suffix
+                dsn = make_url(settings.SQLALCHEMY_URL).set(drivername="postgresql")
+                _probe_pool = await asyncpg.create_pool(
+                    dsn.render_as_string(hide_password=False),
+                    min_size=1,
+                    max_size=2,
+                    timeout=settings.HEALTH_CHECK_TIMEOUT_S,  # Bounds connection setup
+                    command_timeout=settings.HEALTH_CHECK_TIMEOUT_S,
+                )
+                _probe_pool_init_failed = False
+                logger.info("Database probe pool initialized.")
+            except Exception as e:
+                logger.error(
+                    f"Failed to initialize database probe pool: {e!r}",
+                    exc_info=not _probe_pool_init_failed,
+                )
+                _probe_pool_init_failed = True
+                _probe_pool = None  # Ensure it's None if init fails
+    return _probe_pool
+
+async def get_probe_pool() -> Optional[asyncpg.Pool]:
+    """
+    Returns the asyncpg pool used by health probes.
+    Returns None if the pool couldn't be initialized.
+    """
+    if _probe_pool is None:
+        await init_probe_pool()  # Attempt to initialize if not already
+    return _probe_pool
+
+async def close_probe_pool() -> None:
+    """Closes the asyncpg pool used by health probes."""
+    global _probe_pool
+    if _probe_pool is not None:
+        await _probe_pool.close()
+        _probe_pool = None
+        logger.info("Database probe pool closed.")
 
+async def connect_db() -> None:
+    """
+    Opens a first pooled connection at startup, so the first request doesn't
+    pay the connection setup cost and configuration errors surface early.
+    """
+    if async_engine:
+        try:
+            async with async_engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+            logger.info("Database connection successful.")
+        except Exception as e:
+            logger.error(f"Database connection failed on startup: {e}", exc_info=True)
 
-# async def disconnect_db():
-#     if async_engine:
-#         await async_engine.dispose()
-#         logger.info("Database engine disposed.")
 
-# The main.py startup/shutdown events might call these. 
\ No newline at end of file
+async def disconnect_db() -> None:
+    """Closes all pooled database connections."""
+    if async_engine:
+        await async_engine.dispose()
+        logger.info("Database engine disposed.")
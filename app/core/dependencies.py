@@ -1,14 +1,21 @@
 from typing import AsyncGenerator
+from fastapi import Request
+from starlette.exceptions import HTTPException  # Base class of fastapi.HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.db import AsyncSessionFactory  # Import your session factory
 import logging
 
 logger = logging.getLogger(__name__)
 
-async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
+# Safe HTTP methods don't write, so there is nothing to commit. Skipping the
+# COMMIT saves a round-trip per read and shortens each pool checkout.
+_READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+async def get_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """
     FastAPI dependency that provides a SQLAlchemy AsyncSession.
     Manages the session lifecycle per request (commit/rollback/close).
+    Read-only requests skip the COMMIT; the transaction is rolled back on close.
     """
     if AsyncSessionFactory is None:
         logger.error("AsyncSessionFactory is not initialized. Database unavailable.")
@@ -20,9 +27,13 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionFactory() as session:
         try:
             yield session
-            await session.commit()
+            if request.method not in _READ_ONLY_METHODS:
+                await session.commit()
         except Exception as e:
-            logger.error(f"Database session rollback due to exception: {e}", exc_info=True)
+            # HTTPExceptions are expected outcomes (4xx etc.) handled by the API's
+            # exception handlers, so don't pay for formatting a traceback here
+            if not isinstance(e, HTTPException):
+                logger.error(f"Database session rollback due to exception: {e}", exc_info=True)
             await session.rollback()
             raise  # Re-raise the exception to be handled by FastAPI error handlers
         finally:
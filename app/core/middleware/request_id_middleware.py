@@ -1,40 +1,49 @@
-import uuid
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
-from typing import Callable
+from secrets import token_hex
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.request_context import set_request_id
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
+_REQUEST_ID_HEADER = b"x-request-id"  # ASGI header names are lowercase bytes
+
+class RequestIDMiddleware:
     """
-    Middleware that adds a unique request ID to each request.
+    Pure ASGI middleware that adds a unique request ID to each request.
     
     This ID is added to response headers and made available in the
     request context for logging and tracing purposes.
     """
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Check if request already has an ID (e.g., from a load balancer or gateway)
-        request_id = request.headers.get("X-Request-ID")
-        
-        # If not, generate a new UUID
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == _REQUEST_ID_HEADER:
+                request_id = value.decode("latin-1")
+                break
+
+        # If not, generate a new random 128-bit ID (hex, no UUID object round-trip)
         if not request_id:
-            request_id = str(uuid.uuid4())
-        
+            request_id = token_hex(16)
+
         # Store in context var for access in route handlers and loggers
-        token = set_request_id(request_id)
-        
-        # Add ID to request state for potential use in route handlers
-        request.state.request_id = request_id
-        
-        # Process the request and get the response
-        response = await call_next(request)
-        
-        # Add the request ID to the response headers
-        response.headers["X-Request-ID"] = request_id
-        
-        # Reset the context variable token (though usually not necessary due to task context isolation)
-        # ctx_token.reset(token)
-        
-        return response 
\ No newline at end of file
+        set_request_id(request_id)
+
+        # Add ID to request state (request.state.request_id) for potential use in route handlers
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        request_id_header = (_REQUEST_ID_HEADER, request_id.encode("latin-1"))
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Add the request ID to the response headers
+                message["headers"] = [*message.get("headers", ()), request_id_header]
+            await send(message)
+
+        await self.app(scope, receive, send_with_request_id)
@@ -1,15 +1,33 @@
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
-from typing import Callable
-
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        response = await call_next(request)
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY" # Or "SAMEORIGIN"
-        # response.headers["Content-Security-Policy"] = "default-src 'self'; script-src 'self'; object-src 'none';" # Example CSP, very restrictive
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains" # If site is HTTPS only
-        # response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        # response.headers["Permissions-Policy"] = "geolocation=(), microphone=(), camera=()" # Disable features by default
-        return response 
\ No newline at end of file
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from typing import List, Tuple
+
+# The headers never change, so encode them once instead of on every response
+_STATIC_HEADERS: List[Tuple[bytes, bytes]] = [
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),  # Or "SAMEORIGIN"
+    # (b"content-security-policy", b"default-src 'self'; script-src 'self'; object-src 'none';"),  # Example CSP, very restrictive
+    (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),  # If site is HTTPS only
+    # (b"referrer-policy", b"strict-origin-when-cross-origin"),
+    # (b"permissions-policy", b"geolocation=(), microphone=(), camera=()"),  # Disable features by default
+]
+
+class SecurityHeadersMiddleware:
+    """
+    Pure ASGI middleware that adds static security headers to every HTTP response.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_security_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Build a new list: the original may be a Response's own raw_headers
+                message["headers"] = [*message.get("headers", ()), *_STATIC_HEADERS]
+            await send(message)
+
+        await self.app(scope, receive, send_with_security_headers)
@@ -1,13 +1,144 @@
+import asyncio
+import inspect
+import time
 import redis.asyncio as aioredis
+from cachetools import TTLCache
 from redis.asyncio.connection import ConnectionPool
+from redis.commands.helpers import list_or_args
+from redis.typing import KeyT
+from redis.utils import HIREDIS_AVAILABLE
 from app.core.config import settings  # Your Pydantic settings instance
-from typing import Optional
+from typing import Any, Awaitable, List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+
+# Commands forwarded by CachedRedis that can't change data. Any other forwarded
+# command is treated as a potential write and clears the local cache.
+_READ_ONLY_COMMANDS = frozenset({
+    "ping", "exists", "ttl", "pttl", "type", "strlen", "dbsize", "info",
+    "keys", "scan", "hget", "hgetall", "hmget", "hexists", "hlen",
+    "llen", "lrange", "scard", "sismember", "smembers",
+    "zcard", "zrange", "zscore",
+})
+
+
+class CachedRedis:
+    """
+    Wraps a Redis client with a small per-process TTL cache in front of
+    GET and MGET, so repeated reads of a hot key skip the network round-trip.
+
+    Writes made through this wrapper drop the local copy once they complete:
+    set/delete drop their keys, and any other forwarded command that isn't
+    known to be read-only clears the whole local cache. Pipelines and
+    transactions are not tracked; call clear_local() after executing one.
+    Changes made by other processes become visible once the local entry
+    expires, so reads may be up to `ttl` seconds stale. Misses are not cached.
+    """
+
+    def __init__(self, client: aioredis.Redis, maxsize: int, ttl: float) -> None:
+        self._client = client
+        # maxsize or ttl of 0 disables the local cache
+        self._local: Optional[TTLCache] = TTLCache(maxsize=maxsize, ttl=ttl) if maxsize > 0 and ttl > 0 else None
+        # Keys are encoded exactly as the client sends them, so "k", b"k" and
+        # memoryview(b"k") share one local entry, as do 5 and "5"
+        self._encoder = client.connection_pool.get_encoder()
+        # Bumped on every invalidation, so a read that was already in flight
+        # when a write completed doesn't store the value it fetched before it
+        self._generation = 0
+
+    @property
+    def client(self) -> aioredis.Redis:
+        """The underlying Redis client, bypassing the local cache."""
+        return self._client
+
+    def _local_key(self, name: KeyT) -> bytes:
+        return bytes(self._encoder.encode(name))
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._client, name)
+        if self._local is None or name in _READ_ONLY_COMMANDS or not callable(attr):
+            return attr
+
+        def command(*args: Any, **kwargs: Any) -> Any:
+            result = attr(*args, **kwargs)
+            return self._clear_after(result) if inspect.isawaitable(result) else result
+
+        return command
+
+    async def _clear_after(self, write: Awaitable[Any]) -> Any:
+        try:
+            return await write
+        finally:
+            self.clear_local()
+
+    async def get(self, name: KeyT) -> Any:
+        if self._local is None:
+            return await self._client.get(name)
+        key = self._local_key(name)
+        try:
+            return self._local[key]
+        except KeyError:
+            pass
+        generation = self._generation
+        value = await self._client.get(name)
+        if value is not None and generation == self._generation:
+            self._local[key] = value
+        return value
+
+    async def mget(self, keys: Any, *args: Any) -> List[Any]:
+        keys = list_or_args(keys, args)
+        if self._local is None:
+            return await self._client.mget(keys)
+
+        local_keys = [self._local_key(key) for key in keys]
+        values = [self._local.get(local_key) for local_key in local_keys]
+        missing = [i for i, value in enumerate(values) if value is None]
+        if missing:
+            generation = self._generation
+            fetched = await self._client.mget([keys[i] for i in missing])
+            for i, value in zip(missing, fetched):
+                values[i] = value
+                if value is not None and generation == self._generation:
+                    self._local[local_keys[i]] = value
+        return values
+
+    async def set(self, name: KeyT, value: Any, *args: Any, **kwargs: Any) -> Any:
+        try:
+            return await self._client.set(name, value, *args, **kwargs)
+        finally:
+            self.invalidate_local(name)
+
+    async def delete(self, *names: KeyT) -> int:
+        try:
+            return await self._client.delete(*names)
+        finally:
+            self.invalidate_local(*names)
+
+    def invalidate_local(self, *names: KeyT) -> None:
+        """Drops the given keys from the local cache only."""
+        if self._local is not None:
+            self._generation += 1
+            for name in names:
+                self._local.pop(self._local_key(name), None)
+
+    def clear_local(self) -> None:
+        """Drops every key from the local cache only."""
+        if self._local is not None:
+            self._generation += 1
+            self._local.clear()
+
+
 _app_cache_pool: Optional[ConnectionPool] = None
 _app_cache_client: Optional[aioredis.Redis] = None
+_app_local_cache_client: Optional[CachedRedis] = None
+
+# Outcome of the last real PING, shared by all callers of cached_ping()
+_last_redis_ping_ts: float = float("-inf")
+_last_redis_ping_status: str = "not available"
+# Refresh currently in progress, awaited by every caller that finds the cached outcome expired
+_redis_ping_task: Optional["asyncio.Task[str]"] = None
 
 async def init_app_redis_pool():
     """Initializes the Redis connection pool for general application caching."""
@@ -20,7 +151,14 @@ async def init_app_redis_pool():
                 settings.REDIS_CACHE_URL,  # Use the constructed URL from settings
                 max_connections=settings.REDIS_MAX_CONNECTIONS if hasattr(settings, 'REDIS_MAX_CONNECTIONS') else 10,
                 decode_responses=True,  # Automatically decode responses from bytes to str
+                socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+                socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+                socket_keepalive=True,
+                health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+                # No parser_class: redis-py picks the hiredis C parser automatically when installed
             )
+            if not HIREDIS_AVAILABLE:
+                logger.warning("hiredis is not installed; Redis replies will be parsed in pure Python.")
             _app_cache_client = aioredis.Redis(connection_pool=_app_cache_pool)
             # Test connection
             await _app_cache_client.ping()
@@ -41,9 +179,71 @@ async def get_redis_app_cache_client() -> Optional[aioredis.Redis]:
         await init_app_redis_pool()  # Attempt to initialize if not already
     return _app_cache_client  # Could be None if init_app_redis_pool failed
 
+async def get_redis_local_cache_client() -> Optional[CachedRedis]:
+    """
+    Opt-in variant of get_redis_app_cache_client() with a process-local cache
+    in front of GET/MGET (see CachedRedis), for hot keys that tolerate reads
+    up to REDIS_LOCAL_CACHE_TTL seconds stale. The local cache is disabled
+    unless REDIS_LOCAL_CACHE_SIZE is set.
+    Returns None if the pool couldn't be initialized.
+    """
+    global _app_local_cache_client
+    client = await get_redis_app_cache_client()
+    if client is None:
+        return None
+    if _app_local_cache_client is None or _app_local_cache_client.client is not client:
+        _app_local_cache_client = CachedRedis(
+            client,
+            maxsize=settings.REDIS_LOCAL_CACHE_SIZE,
+            ttl=settings.REDIS_LOCAL_CACHE_TTL,
+        )
+    return _app_local_cache_client
+
+async def _ping() -> str:
+    client = await get_redis_app_cache_client()
+    if client is None:
+        return "not available"
+    return "ok" if await client.ping() else "error"
+
+async def _refresh_ping_status() -> str:
+    global _last_redis_ping_ts, _last_redis_ping_status
+    try:
+        ping_status = await asyncio.wait_for(_ping(), timeout=settings.HEALTH_CHECK_TIMEOUT_S)
+    except asyncio.TimeoutError:
+        ping_status = "timeout"
+    except Exception as e:
+        ping_status = f"error: {str(e)}"
+    _last_redis_ping_status = ping_status
+    _last_redis_ping_ts = time.monotonic()
+    return ping_status
+
+async def cached_ping(max_age: float = 5.0) -> str:
+    """
+    Pings the application Redis cache, reusing the last outcome if it is
+    younger than `max_age` seconds. Keeps frequent callers such as health
+    probes from spending a network round-trip on every request; callers
+    arriving while a refresh is in flight share it instead of sending their own.
+
+    Pool initialization and the PING share one HEALTH_CHECK_TIMEOUT_S budget.
+    Every outcome is cached, failures included. Returns "ok", "error",
+    "timeout", "not available" (the pool couldn't be initialized) or
+    "error: <reason>"; never raises.
+    """
+    global _redis_ping_task
+    if time.monotonic() - _last_redis_ping_ts < max_age:
+        return _last_redis_ping_status
+
+    if _redis_ping_task is None or _redis_ping_task.done():
+        _redis_ping_task = asyncio.create_task(_refresh_ping_status())
+    # Shielded so a cancelled caller doesn't cancel the refresh for the others
+    return await asyncio.shield(_redis_ping_task)
+
 async def close_app_redis_pool():
     """Closes the general application Redis connection pool."""
-    global _app_cache_pool, _app_cache_client
+    global _app_cache_pool, _app_cache_client, _app_local_cache_client, _last_redis_ping_ts, _redis_ping_task
+    _last_redis_ping_ts = float("-inf")  # Forget cached PING results
+    _redis_ping_task = None
+    _app_local_cache_client = None
     if _app_cache_client:
         await _app_cache_client.close()  # Close client first
         _app_cache_client = None
@@ -1,3 +1,6 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Awaitable
 from fastapi import FastAPI, Request, status, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
@@ -6,6 +9,7 @@ import logging
 
 from app.core.config import settings
 from app.core.redis_client import init_app_redis_pool, close_app_redis_pool
+from app.core.db import connect_db, disconnect_db, init_probe_pool, close_probe_pool
 from app.api.health import router as health_router
 from app.core.schemas.errors import ErrorResponse, ErrorDetail, ErrorSource, ErrorMeta
 from app.core.middleware.security_headers import SecurityHeadersMiddleware
@@ -15,8 +19,35 @@ from app.core.logging_config import setup_logging
 # Set up structured logging
 setup_logging()
 
+async def _run_with_startup_budget(step: Awaitable[object], name: str) -> None:
+    """Runs a lifespan step, giving up on it after settings.STARTUP_TIMEOUT_S."""
+    try:
+        await asyncio.wait_for(step, timeout=settings.STARTUP_TIMEOUT_S)
+    except asyncio.TimeoutError:
+        logging.warning(f"{name} did not finish within {settings.STARTUP_TIMEOUT_S}s; skipped")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize connections and resources on startup and clean them up on shutdown."""
+    # The initializers are independent, so run them concurrently: startup takes
+    # as long as the slowest one. Each logs and tolerates its own failure, and
+    # each is bounded so an unreachable dependency can't block startup; the
+    # pools are initialized lazily on first use instead.
+    await asyncio.gather(
+        _run_with_startup_budget(init_app_redis_pool(), "Redis pool initialization"),
+        _run_with_startup_budget(init_probe_pool(), "Database probe pool initialization"),
+        _run_with_startup_budget(connect_db(), "Database warm-up"),  # First pooled connection
+    )
+    yield
+    await asyncio.gather(
+        _run_with_startup_budget(close_app_redis_pool(), "Redis pool shutdown"),
+        _run_with_startup_budget(close_probe_pool(), "Database probe pool shutdown"),
+        _run_with_startup_budget(disconnect_db(), "Database engine disposal"),
+    )
+
 app = FastAPI(
     title=settings.APP_NAME,
+    lifespan=lifespan,
     debug=settings.DEBUG_MODE,
     openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
     docs_url=f"{settings.API_V1_PREFIX}/docs",
@@ -33,7 +64,7 @@ app.add_middleware(SecurityHeadersMiddleware)
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[str(origin) for origin in settings.CORS_ALLOWED_ORIGINS],  # Handles Pydantic AnyUrl
+    allow_origins=settings.CORS_ORIGINS_STR,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -127,22 +158,6 @@ async def generic_exception_handler(request: Request, exc: Exception):
         content=ErrorResponse(errors=[error_detail]).model_dump(exclude_none=True)
     )
 
-# Application startup event
-@app.on_event("startup")
-async def on_startup():
-    """Initialize connections and resources on application startup."""
-    # Initialize Redis connection pool
-    await init_app_redis_pool()
-    # Additional startup tasks could be added here
-
-# Application shutdown event
-@app.on_event("shutdown")
-async def on_shutdown():
-    """Clean up connections and resources on application shutdown."""
-    # Close Redis connection pool
-    await close_app_redis_pool()
-    # Additional cleanup tasks could be added here
-
 # Include routers
 app.include_router(health_router, prefix=settings.API_V1_PREFIX)
 
@@ -1,8 +1,7 @@
 import asyncio
 import pytest
 from typing import AsyncGenerator, Generator
-from httpx import AsyncClient
-from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy import text
 
@@ -14,9 +13,7 @@ from app.core.dependencies import get_db_session  # Your DB session dependency
 # 1. Configure Engine for Test Database
 # Ensure DATABASE_URL in settings points to your TEST database for this fixture
 test_engine = create_async_engine(
-    settings.DATABASE_URL.render_as_string(hide_password=False)
-        if hasattr(settings.DATABASE_URL, 'render_as_string')
-        else str(settings.DATABASE_URL),
+    settings.SQLALCHEMY_URL,
     echo=False  # Can set echo=True for debugging SQL
 )
 AsyncTestingSessionLocal = async_sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
@@ -93,27 +90,9 @@ app.dependency_overrides[get_db_session] = override_get_db_session
 # 5. API Test Client Fixture
 @pytest.fixture(scope="function")
 async def test_client() -> AsyncGenerator[AsyncClient, None]:
-    """Provides an httpx.AsyncClient for making API requests to the test app."""
-    # Create a TestClient for FastAPI
-    test_client = TestClient(app)
-    
-    # Create AsyncClient that will use the base_url
-    async with AsyncClient(base_url="http://test") as ac:
-        # For each request made with AsyncClient, 
-        # actually execute it through the FastAPI TestClient
-        original_request = ac.request
-        
-        async def patched_request(*args, **kwargs):
-            method = args[0] if args else kwargs.get("method", "GET")
-            url = args[1] if len(args) > 1 else kwargs.get("url", "")
-            # Remove base_url if it's included
-            if str(url).startswith(str(ac.base_url)):
-                url = str(url)[len(str(ac.base_url)):]
-            # Use the TestClient to execute the request
-            response = test_client.request(method=method, url=url, **kwargs)
-            return response
-        
-        # Replace the request method
-        ac.request = patched_request
-        
-        yield ac 
\ No newline at end of file
+    """
+    Provides an httpx.AsyncClient for making API requests to the test app.
+    Requests are dispatched straight to the ASGI app on the test's event loop.
+    """
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
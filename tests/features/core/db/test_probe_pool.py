@@ -0,0 +1,35 @@
+import asyncio
+
+import pytest
+
+from app.core import db
+from app.core.db import get_probe_pool
+
+class FakePool:
+    async def close(self):
+        pass
+
+@pytest.mark.unit
+async def test_concurrent_first_use_creates_a_single_probe_pool(monkeypatch):
+    """
+    Test that probes arriving together before the pool exists (cold start,
+    database recovery) share one pool instead of each creating and leaking one.
+    """
+    # Arrange
+    created = []
+
+    async def fake_create_pool(*args, **kwargs):
+        await asyncio.sleep(0.01)  # Yield so concurrent callers overlap
+        pool = FakePool()
+        created.append(pool)
+        return pool
+
+    monkeypatch.setattr(db, "_probe_pool", None)
+    monkeypatch.setattr(db.asyncpg, "create_pool", fake_create_pool)
+
+    # Act
+    pools = await asyncio.gather(get_probe_pool(), get_probe_pool(), get_probe_pool())
+
+    # Assert
+    assert len(created) == 1
+    assert all(pool is created[0] for pool in pools)
@@ -0,0 +1,108 @@
+import logging
+
+import pytest
+from fastapi import HTTPException
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.requests import Request
+
+from app.core import dependencies
+from app.core.dependencies import get_db_session
+
+class FakeSession:
+    """Records commit/rollback calls made by get_db_session."""
+
+    def __init__(self):
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+@pytest.fixture
+def fake_session(monkeypatch) -> FakeSession:
+    session = FakeSession()
+    monkeypatch.setattr(dependencies, "AsyncSessionFactory", lambda: session)
+    return session
+
+async def _run_request(method: str) -> None:
+    request = Request({"type": "http", "method": method, "headers": []})
+    dependency = get_db_session(request)
+    await dependency.__anext__()
+    with pytest.raises(StopAsyncIteration):
+        await dependency.__anext__()
+
+@pytest.mark.unit
+@pytest.mark.parametrize("method", ["GET", "HEAD", "OPTIONS"])
+async def test_read_only_requests_skip_commit(fake_session: FakeSession, method: str):
+    """
+    Test that read-only HTTP methods don't COMMIT the request's session.
+    """
+    # Act
+    await _run_request(method)
+
+    # Assert
+    assert fake_session.commits == 0
+
+@pytest.mark.unit
+@pytest.mark.parametrize("method", ["POST", "PUT", "PATCH", "DELETE"])
+async def test_write_requests_commit(fake_session: FakeSession, method: str):
+    """
+    Test that requests with writing HTTP methods COMMIT the request's session.
+    """
+    # Act
+    await _run_request(method)
+
+    # Assert
+    assert fake_session.commits == 1
+    assert fake_session.rollbacks == 0
+
+async def _run_failing_request(exc: Exception) -> None:
+    request = Request({"type": "http", "method": "POST", "headers": []})
+    dependency = get_db_session(request)
+    await dependency.__anext__()
+    with pytest.raises(type(exc)):
+        await dependency.athrow(exc)
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "exc",
+    [HTTPException(status_code=404), StarletteHTTPException(status_code=404)],
+    ids=["fastapi", "starlette"],
+)
+async def test_http_exceptions_roll_back_without_logging_traceback(fake_session: FakeSession, caplog, exc):
+    """
+    Test that an HTTPException (FastAPI's or Starlette's) rolls the session
+    back and is re-raised without an error log.
+    """
+    # Act
+    with caplog.at_level(logging.ERROR, logger="app.core.dependencies"):
+        await _run_failing_request(exc)
+
+    # Assert
+    assert fake_session.rollbacks == 1
+    assert fake_session.commits == 0
+    assert caplog.records == []
+
+@pytest.mark.unit
+async def test_unexpected_exceptions_roll_back_and_log_traceback(fake_session: FakeSession, caplog):
+    """
+    Test that any other exception rolls the session back and is logged with its traceback.
+    """
+    # Act
+    with caplog.at_level(logging.ERROR, logger="app.core.dependencies"):
+        await _run_failing_request(RuntimeError("boom"))
+
+    # Assert
+    assert fake_session.rollbacks == 1
+    assert fake_session.commits == 0
+    assert len(caplog.records) == 1
+    assert caplog.records[0].exc_info is not None
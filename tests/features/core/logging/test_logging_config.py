@@ -0,0 +1,36 @@
+import json
+import logging
+
+import pytest
+
+from app.core.logging_config import CustomJsonFormatter, _orjson_dumps
+
+@pytest.mark.unit
+def test_orjson_dumps_falls_back_for_values_orjson_rejects():
+    """
+    Test that ints wider than 64 bits, which orjson can't encode, are still
+    serialized through the stdlib encoder.
+    """
+    # Act
+    serialized = _orjson_dumps({"big": 2**70}, default=str)
+
+    # Assert
+    assert json.loads(serialized) == {"big": 2**70}
+
+@pytest.mark.unit
+def test_formatter_writes_record_with_oversized_int():
+    """
+    Test that a record carrying an oversized int in `extra` is formatted
+    instead of dropped.
+    """
+    # Arrange
+    formatter = CustomJsonFormatter("%(message)s", json_serializer=_orjson_dumps, json_default=str)
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "hi", None, None)
+    record.big = 2**70
+
+    # Act
+    payload = json.loads(formatter.format(record))
+
+    # Assert
+    assert payload["message"] == "hi"
+    assert payload["big"] == 2**70
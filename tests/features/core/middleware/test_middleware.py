@@ -0,0 +1,35 @@
+import pytest
+from httpx import AsyncClient
+
+@pytest.mark.api
+async def test_response_includes_generated_request_id_and_security_headers(test_client: AsyncClient):
+    """
+    Test that a response to a request without X-Request-ID:
+    - carries a generated 32-character hex X-Request-ID header
+    - carries the static security headers
+    """
+    # Act
+    response = await test_client.get("/api/v1/healthz/live")
+
+    # Assert
+    assert response.status_code == 200
+    request_id = response.headers["X-Request-ID"]
+    assert len(request_id) == 32
+    int(request_id, 16)  # Must be valid hex
+    assert response.headers["X-Content-Type-Options"] == "nosniff"
+    assert response.headers["X-Frame-Options"] == "DENY"
+    assert response.headers["Strict-Transport-Security"] == "max-age=31536000; includeSubDomains"
+
+@pytest.mark.api
+async def test_incoming_request_id_is_echoed_back(test_client: AsyncClient):
+    """
+    Test that an X-Request-ID supplied by the caller (e.g. a gateway) is reused
+    as-is in the response instead of generating a new one.
+    """
+    # Act
+    response = await test_client.get(
+        "/api/v1/healthz/live", headers={"X-Request-ID": "gateway-id-123"}
+    )
+
+    # Assert
+    assert response.headers["X-Request-ID"] == "gateway-id-123"
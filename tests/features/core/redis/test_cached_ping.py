@@ -0,0 +1,116 @@
+import asyncio
+import time
+
+import pytest
+
+from app.core import redis_client
+from app.core.redis_client import cached_ping
+
+@pytest.fixture(autouse=True)
+def fresh_ping_cache(monkeypatch):
+    """Starts every test without a cached PING outcome and with a short timeout."""
+    monkeypatch.setattr(redis_client, "_last_redis_ping_ts", float("-inf"))
+    monkeypatch.setattr(redis_client, "_redis_ping_task", None)
+    monkeypatch.setattr(redis_client.settings, "HEALTH_CHECK_TIMEOUT_S", 0.1)
+
+@pytest.mark.unit
+async def test_hung_client_initialization_reports_timeout_within_budget(monkeypatch):
+    """
+    Test that a Redis that never answers while the pool is being initialized
+    is reported as "timeout" within HEALTH_CHECK_TIMEOUT_S, and that the
+    outcome is cached for the next caller.
+    """
+    # Arrange
+    calls = []
+
+    async def hanging_get_client():
+        calls.append(1)
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr(redis_client, "get_redis_app_cache_client", hanging_get_client)
+
+    # Act
+    started = time.monotonic()
+    first = await cached_ping()
+    elapsed = time.monotonic() - started
+    second = await cached_ping()
+
+    # Assert
+    assert first == second == "timeout"
+    assert elapsed < 1.0
+    assert len(calls) == 1
+
+@pytest.mark.unit
+async def test_unavailable_client_is_reported_and_cached(monkeypatch):
+    """
+    Test that a pool that couldn't be initialized is reported as
+    "not available" and not retried until the cached outcome expires.
+    """
+    # Arrange
+    calls = []
+
+    async def missing_client():
+        calls.append(1)
+        return None
+
+    monkeypatch.setattr(redis_client, "get_redis_app_cache_client", missing_client)
+
+    # Act
+    first = await cached_ping()
+    second = await cached_ping()
+    expired = await cached_ping(max_age=0)
+
+    # Assert
+    assert first == second == expired == "not available"
+    assert len(calls) == 2
+
+@pytest.mark.unit
+async def test_ping_errors_are_reported_not_raised(monkeypatch):
+    """
+    Test that a failing PING is returned as an "error: ..." status.
+    """
+    # Arrange
+    class FailingClient:
+        async def ping(self):
+            raise ConnectionError("connection reset")
+
+    async def failing_client():
+        return FailingClient()
+
+    monkeypatch.setattr(redis_client, "get_redis_app_cache_client", failing_client)
+
+    # Act
+    result = await cached_ping()
+
+    # Assert
+    assert result == "error: connection reset"
+
+@pytest.mark.unit
+async def test_concurrent_callers_share_one_ping(monkeypatch):
+    """
+    Test that callers arriving together after the cached outcome expired
+    (e.g. /health and /healthz/ready) share a single PING.
+    """
+    # Arrange
+    class SlowClient:
+        def __init__(self):
+            self.pings = 0
+
+        async def ping(self):
+            self.pings += 1
+            await asyncio.sleep(0.01)
+            return True
+
+    client = SlowClient()
+
+    async def get_client():
+        return client
+
+    monkeypatch.setattr(redis_client, "get_redis_app_cache_client", get_client)
+
+    # Act
+    results = await asyncio.gather(*(cached_ping() for _ in range(3)))
+
+    # Assert
+    assert results == ["ok", "ok", "ok"]
+    assert client.pings == 1
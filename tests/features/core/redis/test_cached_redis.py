@@ -0,0 +1,234 @@
+import asyncio
+
+import pytest
+from redis.asyncio.connection import Encoder
+
+from app.core.redis_client import CachedRedis
+
+class FakeRedis:
+    """Minimal in-memory stand-in for redis.asyncio.Redis that counts GET/MGET calls."""
+
+    class _Pool:
+        def get_encoder(self):
+            return Encoder(encoding="utf-8", encoding_errors="strict", decode_responses=True)
+
+    def __init__(self):
+        self.data = {}
+        self.get_calls = 0
+        self.mget_calls = 0
+        self.connection_pool = self._Pool()
+
+    def _key(self, name):
+        return bytes(self.connection_pool.get_encoder().encode(name))
+
+    async def get(self, name):
+        self.get_calls += 1
+        return self.data.get(self._key(name))
+
+    async def mget(self, keys):
+        self.mget_calls += 1
+        return [self.data.get(self._key(key)) for key in keys]
+
+    async def set(self, name, value):
+        self.data[self._key(name)] = value
+        return True
+
+    async def setex(self, name, time, value):
+        self.data[self._key(name)] = value
+        return True
+
+    async def incr(self, name, amount=1):
+        value = int(self.data.get(self._key(name), 0)) + amount
+        self.data[self._key(name)] = str(value)
+        return value
+
+    async def delete(self, *names):
+        return sum(self.data.pop(self._key(name), None) is not None for name in names)
+
+    async def ping(self):
+        return True
+
+@pytest.mark.unit
+async def test_get_serves_repeated_reads_from_local_cache():
+    """
+    Test that a repeated GET of the same key within the TTL is answered locally.
+    """
+    # Arrange
+    fake = FakeRedis()
+    fake.data[b"greeting"] = "hello"
+    client = CachedRedis(fake, maxsize=16, ttl=60)
+
+    # Act
+    first = await client.get("greeting")
+    second = await client.get("greeting")
+
+    # Assert
+    assert first == second == "hello"
+    assert fake.get_calls == 1
+
+@pytest.mark.unit
+async def test_misses_are_not_cached():
+    """
+    Test that a GET for a missing key always goes to Redis.
+    """
+    # Arrange
+    fake = FakeRedis()
+    client = CachedRedis(fake, maxsize=16, ttl=60)
+
+    # Act
+    await client.get("missing")
+    await client.get("missing")
+
+    # Assert
+    assert fake.get_calls == 2
+
+@pytest.mark.unit
+async def test_set_and_delete_invalidate_local_copy():
+    """
+    Test that writes through the wrapper are visible to the next read.
+    """
+    # Arrange
+    fake = FakeRedis()
+    client = CachedRedis(fake, maxsize=16, ttl=60)
+    await client.set("key", "v1")
+    assert await client.get("key") == "v1"
+
+    # Act / Assert
+    await client.set("key", "v2")
+    assert await client.get("key") == "v2"
+    await client.delete("key")
+    assert await client.get("key") is None
+
+@pytest.mark.unit
+async def test_mget_fetches_only_uncached_keys():
+    """
+    Test that MGET answers cached keys locally, fetches the rest in one call,
+    and keeps the order of the requested keys.
+    """
+    # Arrange
+    fake = FakeRedis()
+    fake.data.update({b"a": "1", b"b": "2"})
+    client = CachedRedis(fake, maxsize=16, ttl=60)
+    await client.get("a")
+
+    # Act
+    values = await client.mget("a", "b", "c")
+
+    # Assert
+    assert values == ["1", "2", None]
+    assert fake.mget_calls == 1
+    assert await client.mget(["a", "b"]) == ["1", "2"]
+    assert fake.mget_calls == 1
+
+@pytest.mark.unit
+async def test_zero_size_disables_local_cache_and_other_commands_are_forwarded():
+    """
+    Test that maxsize=0 turns the wrapper into a pass-through.
+    """
+    # Arrange
+    fake = FakeRedis()
+    fake.data[b"key"] = "value"
+    client = CachedRedis(fake, maxsize=0, ttl=60)
+
+    # Act
+    await client.get("key")
+    await client.get("key")
+
+    # Assert
+    assert fake.get_calls == 2
+    assert await client.ping() is True
+
+@pytest.mark.unit
+async def test_forwarded_write_commands_invalidate_local_copy():
+    """
+    Test that writes without a dedicated wrapper method (setex, incr, ...)
+    still drop the local copy, so the next read sees the new value.
+    """
+    # Arrange
+    fake = FakeRedis()
+    client = CachedRedis(fake, maxsize=16, ttl=60)
+    await client.set("k", "v1")
+    await client.set("n", "1")
+    assert await client.get("k") == "v1"
+    assert await client.get("n") == "1"
+
+    # Act
+    await client.setex("k", 10, "v2")
+    await client.incr("n")
+
+    # Assert
+    assert await client.get("k") == "v2"
+    assert await client.get("n") == "2"
+
+@pytest.mark.unit
+async def test_str_and_bytes_keys_share_one_local_entry():
+    """
+    Test that "k" and b"k" are the same key locally, as they are in Redis.
+    """
+    # Arrange
+    fake = FakeRedis()
+    fake.data[b"k"] = "v1"
+    client = CachedRedis(fake, maxsize=16, ttl=60)
+    await client.get("k")
+
+    # Act
+    await client.set(b"k", "v2")
+
+    # Assert
+    assert await client.get("k") == "v2"
+    assert await client.get(b"k") == "v2"
+    assert fake.get_calls == 2
+
+@pytest.mark.unit
+async def test_numeric_keys_share_local_entry_with_their_string_form():
+    """
+    Test that 5 and "5" are the same key locally, as they are in Redis, so a
+    write through one form invalidates a value cached through the other.
+    """
+    # Arrange
+    fake = FakeRedis()
+    client = CachedRedis(fake, maxsize=16, ttl=60)
+    await client.set("5", "v1")
+    assert await client.get(5) == "v1"
+
+    # Act
+    await client.set("5", "v2")
+
+    # Assert
+    assert await client.get(5) == "v2"
+    await client.delete("5")
+    assert await client.get(5) is None
+
+@pytest.mark.unit
+async def test_read_in_flight_during_write_does_not_repopulate_stale_value():
+    """
+    Test that a GET which fetched the old value before a write completed
+    doesn't put that value back into the local cache.
+    """
+    # Arrange
+    fake = FakeRedis()
+    fake.data[b"k"] = "old"
+    client = CachedRedis(fake, maxsize=16, ttl=60)
+    fetched = asyncio.Event()
+    release = asyncio.Event()
+    original_get = fake.get
+
+    async def slow_get(name):
+        value = await original_get(name)
+        fetched.set()
+        await release.wait()
+        return value
+
+    fake.get = slow_get
+
+    # Act
+    in_flight = asyncio.create_task(client.get("k"))
+    await fetched.wait()
+    await client.set("k", "new")
+    release.set()
+    stale = await in_flight
+    fake.get = original_get
+
+    # Assert
+    assert stale == "old"
+    assert await client.get("k") == "new"
@@ -1,6 +1,9 @@
 import pytest
 from httpx import AsyncClient
 
+from app.main import app
+from app.core.dependencies import get_db_session
+
 @pytest.mark.api
 async def test_healthz_live_returns_200_with_alive_status(test_client: AsyncClient):
     """
@@ -16,4 +19,35 @@ async def test_healthz_live_returns_200_with_alive_status(test_client: AsyncClie
     
     # Assert
     assert response.status_code == 200
-    assert response.json() == {"status": "alive"} 
\ No newline at end of file
+    assert response.json() == {"status": "alive"} 
+
+@pytest.mark.api
+@pytest.mark.parametrize("path", ["/api/v1/health", "/api/v1/healthz/ready"])
+async def test_health_probes_do_not_open_a_db_session(test_client: AsyncClient, path: str):
+    """
+    Test that the dependency-checking probes never resolve get_db_session:
+    they ping the database over a bare connection instead of allocating an
+    ORM session with its own BEGIN/COMMIT.
+    """
+    # Arrange
+    calls = []
+
+    async def tracking_get_db_session():
+        calls.append(path)
+        yield None
+
+    original_override = app.dependency_overrides.get(get_db_session)
+    app.dependency_overrides[get_db_session] = tracking_get_db_session
+
+    # Act
+    try:
+        response = await test_client.get(path)
+    finally:
+        if original_override is None:
+            app.dependency_overrides.pop(get_db_session, None)
+        else:
+            app.dependency_overrides[get_db_session] = original_override
+
+    # Assert
+    assert response.status_code in (200, 503)
+    assert calls == []